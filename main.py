@@ -1,18 +1,47 @@
+from __future__ import annotations
+
+import functools
+import json
 import os
+import shutil
+import stat
 import subprocess
 import sys
+from typing import TYPE_CHECKING
 
-from git import Repo
-from git.exc import InvalidGitRepositoryError
-from openai import OpenAI
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
+
+# git, openai and the rest of rich are imported where they are used, so
+# runs that exit early don't pay for loading them
+if TYPE_CHECKING:
+    from git import Repo
+    from openai import OpenAI
+    from rich.progress import Progress, TaskID
 
 console = Console()
 
+# Resolve git once; an absolute path lets subprocess use posix_spawn and
+# spares GitPython a PATH search on every command
+GIT_PATH = shutil.which("git") or "git"
+
+MAX_DIFF_BYTES = 8000
+# Share of the prompt the per-file summary may take in summarize_diff
+FILE_LIST_BYTES = MAX_DIFF_BYTES // 4
+STATUS_CACHE_FILE = "gitsync-cache.json"
+TRIVIAL_CHANGE_LINES = 3
+DOC_EXTENSIONS = (".md", ".rst", ".txt")
+
+# Porcelain status letters, as the raw bytes git prints them
+STATUS_MAP: dict[bytes, str] = {
+    b"M": "Modified",
+    b"T": "Modified",
+    b"A": "Added",
+    b"D": "Deleted",
+    b"R": "Renamed",
+    b"C": "Copied",
+}
+
 
 def has_remote(repo: Repo) -> bool:
     """Check if repository has a remote configured."""
@@ -69,6 +98,15 @@ def create_github_repo(repo_name: str, private: bool = True) -> bool:
 
 def get_repo() -> Repo | None:
     """Get the git repository for current directory."""
+    import git
+    from git import Repo
+    from git.exc import InvalidGitRepositoryError
+
+    # Point GitPython at the resolved binary; assigning the class attribute
+    # spawns nothing, unlike git.refresh(), and leaves os.environ alone
+    if os.path.isabs(GIT_PATH) and "GIT_PYTHON_GIT_EXECUTABLE" not in os.environ:
+        git.Git.GIT_PYTHON_GIT_EXECUTABLE = GIT_PATH
+
     try:
         return Repo(".", search_parent_directories=True)
     except InvalidGitRepositoryError:
@@ -77,6 +115,8 @@ def get_repo() -> Repo | None:
 
 def init_git_repo() -> Repo:
     """Initialize a new git repository in the current directory."""
+    from git import Repo
+
     try:
         return Repo.init(".")
     except Exception as e:
@@ -84,80 +124,314 @@ def init_git_repo() -> Repo:
         sys.exit(1)
 
 
+def parse_numstat(output: bytes) -> dict[str, tuple[int, int]]:
+    """Parse `git diff --numstat -z` output into {filename: (additions, deletions)}."""
+    stats = {}
+    records = iter(output.split(b"\0"))
+    for record in records:
+        parts = record.split(b"\t", 2)
+        if len(parts) < 3:
+            continue
+        path = parts[2]
+        if not path:
+            # Renames and copies list the old and new paths as separate records
+            next(records, None)
+            path = next(records, b"")
+        additions = int(parts[0]) if parts[0] != b"-" else 0
+        deletions = int(parts[1]) if parts[1] != b"-" else 0
+        stats[os.fsdecode(path)] = (additions, deletions)
+    return stats
+
+
+def enable_untracked_cache(repo: Repo) -> None:
+    """Turn on git's untracked cache unless core.untrackedCache is already set."""
+    from git.exc import GitCommandError
+
+    with repo.config_reader() as reader:
+        if reader.has_option("core", "untrackedCache"):
+            return
+    try:
+        repo.git.config("core.untrackedCache", "true")
+        repo.git.update_index("--untracked-cache")
+    except GitCommandError:
+        pass
+
+
+def count_lines(path: str) -> int:
+    """Count a file's lines the way numstat would, treating binary files as 0."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return 0
+    # git diffs a symlink's target text, a single line; FIFOs, sockets and
+    # devices have no content to count and could block on open()
+    if stat.S_ISLNK(st.st_mode):
+        return 1
+    if not stat.S_ISREG(st.st_mode):
+        return 0
+
+    lines, last = 0, b"\n"
+    try:
+        with open(path, "rb") as fh:
+            # Like git, treat a NUL byte in the first 8000 bytes as binary
+            chunk = fh.read(8000)
+            if b"\0" in chunk:
+                return 0
+            while chunk:
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+                chunk = fh.read(65536)
+    except OSError:
+        return 0
+    if last != b"\n":
+        lines += 1
+    return lines
+
+
+def index_mtime(repo: Repo) -> int | None:
+    """Return the index file's mtime in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(os.path.join(repo.git_dir, "index")).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def status_cache_key(repo: Repo, head: str | None, files: dict[str, dict]) -> list:
+    """Fingerprint HEAD, the index and the stat info of every changed file."""
+    entries = []
+    for f in files.values():
+        try:
+            st = os.lstat(os.path.join(repo.working_dir, f["filename"]))
+            stat_info = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            stat_info = None
+        entries.append([f["filename"], f["status"], f["change_type"], stat_info])
+    return [head, index_mtime(repo), entries]
+
+
+def load_status_cache(repo: Repo, key: list) -> list[dict] | None:
+    """Return the changed files cached for `key` by a previous run, if any."""
+    try:
+        with open(os.path.join(repo.git_dir, STATUS_CACHE_FILE)) as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+    return cache.get("files")
+
+
+def save_status_cache(repo: Repo, key: list, files: list[dict]) -> None:
+    """Save the changed files so an unchanged repo can skip the diff stats."""
+    try:
+        with open(os.path.join(repo.git_dir, STATUS_CACHE_FILE), "w") as fh:
+            json.dump({"key": key, "files": files}, fh)
+    except OSError:
+        pass
+
+
 def get_changed_files(repo: Repo) -> list[dict]:
     """Get list of changed files with their status and diff stats."""
-    files = []
-
-    # Get unstaged changes (working tree vs index)
-    for diff in repo.index.diff(None):
-        files.append(
-            {
-                "filename": diff.a_path or diff.b_path,
-                "status": "Modified" if diff.change_type == "M" else diff.change_type,
-                "additions": 0,
-                "deletions": 0,
-                "change_type": "unstaged",
-            }
-        )
+    files = get_changed_files_libgit2(repo)
+    if files is None:
+        files = get_changed_files_cli(repo)
+    return files
+
 
-    # Get staged changes (index vs HEAD)
+def get_changed_files_libgit2(repo: Repo) -> list[dict] | None:
+    """Get changed files in-process via pygit2, or None if it can't be used."""
     try:
-        staged_diffs = repo.index.diff("HEAD")
-    except Exception:
-        staged_diffs = repo.index.diff(repo.head.commit) if repo.head.is_valid() else []
+        import pygit2
+        from pygit2.enums import FileStatus
+    except ImportError:
+        return None
 
-    for diff in staged_diffs:
-        existing = next(
-            (f for f in files if f["filename"] == (diff.a_path or diff.b_path)), None
-        )
-        if existing:
-            existing["change_type"] = "both"
+    try:
+        lg_repo = pygit2.Repository(repo.git_dir)
+        if lg_repo.head_is_unborn:
+            return None
+        head = str(lg_repo.head.target)
+        status = lg_repo.status()
+    except pygit2.GitError:
+        return None
+
+    index_map = {
+        FileStatus.INDEX_NEW: "Added",
+        FileStatus.INDEX_MODIFIED: "Modified",
+        FileStatus.INDEX_TYPECHANGE: "Modified",
+        FileStatus.INDEX_DELETED: "Deleted",
+        FileStatus.INDEX_RENAMED: "Renamed",
+    }
+    worktree_map = {
+        FileStatus.WT_MODIFIED: "Modified",
+        FileStatus.WT_TYPECHANGE: "Modified",
+        FileStatus.WT_DELETED: "Deleted",
+        FileStatus.WT_RENAMED: "Renamed",
+    }
+    files = {}
+    for path, flags in sorted(status.items()):
+        staged = any(flags & flag for flag in index_map)
+        unstaged = any(flags & flag for flag in worktree_map)
+        if flags & FileStatus.CONFLICTED:
+            status_name, change_type = "Unmerged", "both"
+        elif flags & FileStatus.WT_NEW and not staged:
+            status_name, change_type = "Untracked", "untracked"
+        elif staged or unstaged:
+            mapping = index_map if staged else worktree_map
+            status_name = next(name for flag, name in mapping.items() if flags & flag)
+            if staged and unstaged:
+                change_type = "both"
+            else:
+                change_type = "staged" if staged else "unstaged"
         else:
-            status_map = {"M": "Modified", "A": "Added", "D": "Deleted", "R": "Renamed"}
-            files.append(
-                {
-                    "filename": diff.a_path or diff.b_path,
-                    "status": status_map.get(diff.change_type, diff.change_type),
-                    "additions": 0,
-                    "deletions": 0,
-                    "change_type": "staged",
-                }
-            )
+            continue
+
+        files[path] = {
+            "filename": path,
+            "status": status_name,
+            "additions": 0,
+            "deletions": 0,
+            "change_type": change_type,
+        }
 
-    # Get untracked files
-    for filepath in repo.untracked_files:
-        files.append(
-            {
-                "filename": filepath,
+    cache_key = status_cache_key(repo, head, files)
+    cached = load_status_cache(repo, cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        staged_diff = lg_repo.diff("HEAD", cached=True)
+        staged_diff.find_similar()
+        unstaged_diff = lg_repo.diff()
+    except pygit2.GitError:
+        return None
+
+    # Patch line stats replace the numstat subprocesses
+    for diff in (staged_diff, unstaged_diff):
+        for patch in diff:
+            delta = patch.delta
+            if delta.status_char() == "R":
+                # status() can't detect renames, so fold the old path in here;
+                # if it was recreated in the worktree it is untracked again
+                old_path = delta.old_file.path
+                old_flags = status.get(old_path)
+                if old_flags == FileStatus.INDEX_DELETED:
+                    files.pop(old_path, None)
+                elif old_flags is not None and old_flags & FileStatus.WT_NEW:
+                    files[old_path].update(status="Untracked", change_type="untracked")
+                if delta.new_file.path in files:
+                    files[delta.new_file.path]["status"] = "Renamed"
+            f = files.get(delta.new_file.path)
+            if f is None or f["status"] == "Untracked":
+                continue
+            _, additions, deletions = patch.line_stats
+            f["additions"] += additions
+            f["deletions"] += deletions
+
+    for f in files.values():
+        if f["status"] == "Untracked":
+            f["additions"] = count_lines(os.path.join(repo.working_dir, f["filename"]))
+
+    # Match git status ordering: tracked changes first, then untracked files
+    result = sorted(files.values(), key=lambda f: f["status"] == "Untracked")
+    save_status_cache(repo, cache_key, result)
+    return result
+
+
+def get_changed_files_cli(repo: Repo) -> list[dict]:
+    """Get changed files by parsing git status and numstat output."""
+    files = {}
+    head = None
+
+    # Only git status reads the untracked cache; libgit2 ignores it, so the
+    # config is touched only when this fallback is actually used
+    enable_untracked_cache(repo)
+
+    # One porcelain v2 pass covers HEAD plus staged, unstaged and untracked files
+    output = repo.git.status(
+        "--porcelain=v2",
+        "-z",
+        "--branch",
+        "--untracked-files=all",
+        stdout_as_string=False,
+    )
+    records = iter(output.split(b"\0"))
+    for record in records:
+        kind = record[:1]
+        if record.startswith(b"# branch.oid "):
+            head = record.removeprefix(b"# branch.oid ").decode()
+            continue
+        if kind == b"?":
+            path = os.fsdecode(record[2:])
+            files[path] = {
+                "filename": path,
                 "status": "Untracked",
                 "additions": 0,
                 "deletions": 0,
                 "change_type": "untracked",
             }
-        )
+            continue
 
-    # Calculate diff stats using git diff
-    for f in files:
+        if kind == b"1":
+            fields = record.split(b" ", 8)
+        elif kind == b"2":
+            fields = record.split(b" ", 9)
+            # Renamed/copied entries are followed by their original path
+            next(records, None)
+        elif kind == b"u":
+            fields = record.split(b" ", 10)
+        else:
+            continue
+
+        path, xy = os.fsdecode(fields[-1]), fields[1]
+        staged, unstaged = xy[:1] != b".", xy[1:2] != b"."
+        if kind == b"u":
+            status, change_type = "Unmerged", "both"
+        else:
+            code = xy[:1] if staged else xy[1:2]
+            status = STATUS_MAP.get(code, code.decode())
+            if staged and unstaged:
+                change_type = "both"
+            else:
+                change_type = "staged" if staged else "unstaged"
+
+        files[path] = {
+            "filename": path,
+            "status": status,
+            "additions": 0,
+            "deletions": 0,
+            "change_type": change_type,
+        }
+
+    cache_key = status_cache_key(repo, head, files)
+    cached = load_status_cache(repo, cache_key)
+    if cached is not None:
+        return cached
+
+    # Calculate diff stats with one batched numstat per side; the two walks
+    # are independent, so both processes are started before either is read
+    procs = [
+        spawn_git(repo, "diff", "--numstat", "-z"),
+        spawn_git(repo, "diff", "--cached", "--numstat", "-z"),
+    ]
+    side_stats = []
+    for proc in procs:
+        output, _ = proc.communicate()
+        side_stats.append(parse_numstat(output) if proc.returncode == 0 else {})
+
+    for f in files.values():
         if f["status"] == "Untracked":
+            # Not in either diff; count the new file's lines directly
+            f["additions"] = count_lines(os.path.join(repo.working_dir, f["filename"]))
             continue
-        try:
-            diff_output = repo.git.diff("--numstat", "--", f["filename"])
-            if diff_output:
-                parts = diff_output.strip().split("\t")
-                if len(parts) >= 2:
-                    f["additions"] = int(parts[0]) if parts[0] != "-" else 0
-                    f["deletions"] = int(parts[1]) if parts[1] != "-" else 0
-
-            staged_output = repo.git.diff("--cached", "--numstat", "--", f["filename"])
-            if staged_output:
-                parts = staged_output.strip().split("\t")
-                if len(parts) >= 2:
-                    f["additions"] += int(parts[0]) if parts[0] != "-" else 0
-                    f["deletions"] += int(parts[1]) if parts[1] != "-" else 0
-        except Exception:
-            pass
+        for stats in side_stats:
+            additions, deletions = stats.get(f["filename"], (0, 0))
+            f["additions"] += additions
+            f["deletions"] += deletions
 
-    return files
+    result = list(files.values())
+    save_status_cache(repo, cache_key, result)
+    return result
 
 
 def display_changes(files: list[dict]) -> None:
@@ -171,29 +445,119 @@ def display_changes(files: list[dict]) -> None:
         console.print(" ".join(parts))
 
 
-def get_full_diff(repo: Repo) -> str:
-    """Get the full diff for commit message generation."""
-    diff_content = ""
+def spawn_git(repo: Repo, *args: str) -> subprocess.Popen:
+    """Start a git command in the repository without waiting for it to finish."""
+    # -C instead of cwd= keeps Popen on its posix_spawn fast path
+    return subprocess.Popen(
+        [GIT_PATH, "-C", repo.working_dir, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
 
-    # Staged diff
-    staged = repo.git.diff("--cached")
-    if staged:
-        diff_content += f"Staged changes:\n{staged}\n"
 
-    # Unstaged diff
-    unstaged = repo.git.diff()
-    if unstaged:
-        diff_content += f"Unstaged changes:\n{unstaged}\n"
+def read_capped(proc: subprocess.Popen, limit: int) -> bytes:
+    """Read at most `limit` bytes of a process's output, then stop it."""
+    output = proc.stdout.read(limit) if limit > 0 else b""
+    proc.stdout.close()
+    # SIGTERM rather than SIGKILL so git can remove any index.lock it holds
+    proc.terminate()
+    proc.wait()
+    return output
 
-    # Untracked files
-    untracked = repo.untracked_files
-    if untracked:
-        diff_content += f"New untracked files:\n{chr(10).join(untracked)}\n"
 
-    return diff_content[:8000]
+def get_full_diff(repo: Repo) -> str:
+    """Get the full diff for commit message generation."""
+    diff_content = b""
+
+    # Start all three read-only commands up front so they run concurrently
+    sections = [
+        (b"Staged changes:\n", spawn_git(repo, "diff", "--cached")),
+        (b"Unstaged changes:\n", spawn_git(repo, "diff")),
+        (
+            b"New untracked files:\n",
+            spawn_git(repo, "ls-files", "-z", "--others", "--exclude-standard"),
+        ),
+    ]
+
+    # Only read as much output as still fits in the prompt budget
+    for header, proc in sections:
+        budget = MAX_DIFF_BYTES - len(diff_content) - len(header)
+        output = read_capped(proc, budget).replace(b"\0", b"\n")
+        if output:
+            diff_content += header + output
+
+    return diff_content.decode(errors="replace")
+
+
+def trivial_commit_message(files: list[dict]) -> str | None:
+    """Build a message locally for a single tiny change, or None to ask the LLM."""
+    if len(files) != 1:
+        return None
+    f = files[0]
+    if f["additions"] + f["deletions"] > TRIVIAL_CHANGE_LINES:
+        return None
 
+    verbs = {
+        "Added": "add",
+        "Untracked": "add",
+        "Deleted": "remove",
+        "Renamed": "rename",
+    }
+    verb = verbs.get(f["status"], "update")
+    name = os.path.basename(f["filename"]).lower()
+    is_doc = name.startswith("readme") or name.endswith(DOC_EXTENSIONS)
+    prefix = "docs" if is_doc else "chore"
+    return f"{prefix}: {verb} {f['filename']}"
+
+
+def summarize_diff(diff: str, files: list[dict]) -> str:
+    """Condense a diff to a per-file summary plus its added and removed lines."""
+    lines = []
+    budget = FILE_LIST_BYTES
+    for i, f in enumerate(files):
+        entry = f"{f['status']} {f['filename']} (+{f['additions']}/-{f['deletions']})"
+        budget -= len(os.fsencode(entry)) + 1
+        if budget < 0:
+            lines.append(f"... and {len(files) - i} more files")
+            break
+        lines.append(entry)
+    lines.append("")
+
+    in_header = False
+    old_path = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            in_header = True
+        elif line.startswith("@@"):
+            in_header = False
+        elif in_header:
+            # Keep just the file name out of each header block
+            if line.startswith("--- "):
+                old_path = line[4:].rstrip("\t").removeprefix("a/")
+            elif line.startswith("+++ "):
+                new_path = line[4:].rstrip("\t").removeprefix("b/")
+                lines.append(f"{old_path if new_path == '/dev/null' else new_path}:")
+        elif line.startswith(("+", "-")):
+            # Collapse runs of identical blank/whitespace-only changes
+            if not line[1:].strip() and line == lines[-1]:
+                continue
+            lines.append(line)
+
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Create the OpenRouter client once so later calls reuse its connections."""
+    from openai import OpenAI
+
+    return OpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key,
+    )
 
-def generate_commit_message(diff: str) -> str:
+
+def generate_commit_message(diff: str, files: list[dict]) -> str:
     """Generate commit message using OpenRouter API."""
     api_key = os.environ.get("OPENROUTER_API_KEY")
     if not api_key:
@@ -202,10 +566,7 @@ def generate_commit_message(diff: str) -> str:
         )
         sys.exit(1)
 
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    client = get_openai_client(api_key)
 
     prompt = f"""Generate a concise git commit message for the following changes.
 Follow conventional commit format (e.g., feat:, fix:, docs:, refactor:, etc.).
@@ -213,7 +574,7 @@ Keep the first line under 72 characters. Add a brief body if needed.
 Only output the commit message, nothing else.
 
 Changes:
-{diff}"""
+{summarize_diff(diff, files)}"""
 
     response = client.chat.completions.create(
         model="google/gemini-2.5-flash-lite",
@@ -228,7 +589,7 @@ def commit_changes(repo: Repo, message: str) -> bool:
     """Stage all changes and commit."""
     try:
         repo.git.add("-A")
-        repo.index.commit(message)
+        repo.git.commit("-m", message)
         return True
     except Exception as e:
         console.print(f"[red]Error committing: {e}[/red]")
@@ -252,23 +613,40 @@ def push_changes(repo: Repo) -> bool:
         return False
 
 
+def finish_task(progress: Progress, task: TaskID, description: str) -> None:
+    """Replace a task's spinner with a static result line above the display."""
+    progress.remove_task(task)
+    progress.refresh()
+    progress.console.print(description, highlight=False)
+
+
 def main():
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     console.print(
         Panel.fit(
             "[bold blue]GitSync[/bold blue] - Auto Git Commit", border_style="blue"
         )
     )
 
-    # Check if git repo
-    with Progress(
+    # One live display is shared by every stage; it is stopped around prompts
+    progress = Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-    ) as progress:
+        transient=True,
+    )
+
+    with progress:
+        # Check if git repo
         task = progress.add_task("Checking git repository...", total=None)
         repo = get_repo()
 
-        if not repo:
+        if repo:
+            finish_task(progress, task, "[green]Git repository found[/green]")
+        else:
+            progress.remove_task(task)
             progress.stop()
             console.print("[yellow]No git repository found in current directory.[/yellow]")
 
@@ -279,114 +657,91 @@ def main():
                 console.print("[red]Cannot continue without a git repository.[/red]")
                 sys.exit(1)
 
-        progress.update(task, description="[green]Git repository found[/green]")
-
-    # Check for remote
-    console.print()
-    if not has_remote(repo):
-        console.print("[yellow]No remote repository configured.[/yellow]")
+        # Check for remote
+        console.print()
+        if not has_remote(repo):
+            progress.stop()
+            console.print("[yellow]No remote repository configured.[/yellow]")
 
-        if not check_gh_cli():
-            sys.exit(1)
+            if not check_gh_cli():
+                sys.exit(1)
 
-        if Confirm.ask("Would you like to create a GitHub repository?"):
-            default_name = os.path.basename(os.getcwd())
-            repo_name = Prompt.ask("Repository name", default=default_name)
-            private = Confirm.ask("Make repository private?", default=True)
+            if Confirm.ask("Would you like to create a GitHub repository?"):
+                default_name = os.path.basename(os.getcwd())
+                repo_name = Prompt.ask("Repository name", default=default_name)
+                private = Confirm.ask("Make repository private?", default=True)
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
+                progress.start()
                 task = progress.add_task("Creating GitHub repository...", total=None)
 
                 if create_github_repo(repo_name, private):
-                    progress.update(
+                    finish_task(
+                        progress,
                         task,
-                        description=f"[green]Repository '{repo_name}' created![/green]",
+                        f"[green]Repository '{repo_name}' created![/green]",
                     )
                 else:
-                    progress.update(
-                        task, description="[red]Failed to create repository[/red]"
+                    finish_task(
+                        progress, task, "[red]Failed to create repository[/red]"
                     )
                     sys.exit(1)
-        else:
-            console.print(
-                "[yellow]Skipping remote setup. Commit will be local only.[/yellow]"
-            )
+            else:
+                console.print(
+                    "[yellow]Skipping remote setup. Commit will be local only.[/yellow]"
+                )
 
-    # Get changed files
-    console.print()
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+        # Get changed files
+        progress.start()
+        console.print()
         task = progress.add_task("Checking for changes...", total=None)
         files = get_changed_files(repo)
-        progress.update(
-            task, description=f"[green]Found {len(files)} changed file(s)[/green]"
+        finish_task(
+            progress, task, f"[green]Found {len(files)} changed file(s)[/green]"
         )
 
-    if not files:
-        console.print("[yellow]No changes to commit[/yellow]")
-        sys.exit(0)
+        if not files:
+            console.print("[yellow]No changes to commit[/yellow]")
+            sys.exit(0)
 
-    console.print()
-    display_changes(files)
-    console.print()
+        console.print()
+        display_changes(files)
+        console.print()
 
-    # Generate commit message
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+        # Generate commit message
         task = progress.add_task("Generating commit message...", total=None)
-        diff = get_full_diff(repo)
-        message = generate_commit_message(diff)
-        progress.update(task, description="[green]Commit message generated[/green]")
+        message = trivial_commit_message(files)
+        if message is None:
+            diff = get_full_diff(repo)
+            message = generate_commit_message(diff, files)
+        finish_task(progress, task, "[green]Commit message generated[/green]")
 
-    console.print()
-    console.print(
-        Panel(message, title="Generated Commit Message", border_style="green")
-    )
-    console.print()
+        console.print()
+        console.print(
+            Panel(message, title="Generated Commit Message", border_style="green")
+        )
+        console.print()
 
-    # Commit changes
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+        # Commit changes
         task = progress.add_task("Committing changes...", total=None)
-        success = commit_changes(repo, message)
-
-        if success:
-            progress.update(
-                task, description="[green]Changes committed successfully![/green]"
+        if commit_changes(repo, message):
+            finish_task(
+                progress, task, "[green]Changes committed successfully![/green]"
             )
         else:
-            progress.update(task, description="[red]Commit failed[/red]")
+            finish_task(progress, task, "[red]Commit failed[/red]")
             sys.exit(1)
 
-    # Push to remote if configured
-    if has_remote(repo):
-        console.print()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        # Push to remote if configured
+        if has_remote(repo):
+            console.print()
             task = progress.add_task("Pushing to remote...", total=None)
 
             if push_changes(repo):
-                progress.update(
-                    task, description="[green]Pushed to remote successfully![/green]"
+                finish_task(
+                    progress, task, "[green]Pushed to remote successfully![/green]"
                 )
             else:
-                progress.update(task, description="[red]Push failed[/red]")
+                finish_task(progress, task, "[red]Push failed[/red]")
                 sys.exit(1)
 
     console.print()